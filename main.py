@@ -1,21 +1,131 @@
+try:
+    # Under gunicorn's gevent worker, sockets must be patched before
+    # requests is imported so blocking upstream calls yield to other
+    # greenlets instead of stalling the worker.
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
 from flask_wtf import FlaskForm
 from wtforms import StringField, SubmitField, SelectField, IntegerField
 from wtforms.validators import Length, InputRequired, DataRequired, Optional
 from flask import Flask, render_template, redirect, url_for, session
 from flask_bootstrap import Bootstrap5
+import orjson
 import requests
-from datetime import datetime, date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date
 from places import us_cities, COUNTRY_TO_ISO
 import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 # OpenWeatherMap API key
 
+# OpenWeatherMap key resolved once at import, like SECRET_KEY below
+API_KEY = os.environ.get("API_KEY")
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get("SECRET_KEY")
 Bootstrap5(app)
 
+# Server-side sessions: when Redis is configured, the cookie carries only
+# an opaque session id instead of the full signed payload on every
+# request/response. Without REDIS_URL the default cookie session is used.
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    import redis
+    from flask_session import Session
+
+    app.config["SESSION_TYPE"] = "redis"
+    app.config["SESSION_REDIS"] = redis.Redis.from_url(REDIS_URL)
+    Session(app)
+
 
 
 country_choices = [("", "Select a Country")] + [(name, name) for name in COUNTRY_TO_ISO.keys()]
+STATE_CHOICES = [("", "Select a U.S. State, if any.")] + [(s, s) for s in us_cities.keys()]
+
+# Case-insensitive O(1) index of casefolded city name -> (lat, lon);
+# us_cities itself is only needed for the SelectField choices above.
+US_CITY_INDEX = {
+    state: {c.casefold(): coords for c, coords in cities.items()}
+    for state, cities in us_cities.items()
+}
+
+# -------------------- HTTP session --------------------
+# Shared session so keep-alive and connection pooling skip the TCP+TLS
+# handshake on repeat calls to Nominatim and OpenWeather.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "weather-app"})
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+SESSION.mount("https://nominatim.openstreetmap.org", _adapter)
+SESSION.mount("https://api.openweathermap.org", _adapter)
+
+# -------------------- Geocoding --------------------
+GEOCODE_CACHE_MAX = 4096
+GEOCODE_TTL_FOUND = 14 * 24 * 3600  # city coordinates don't move; keep hits for 2 weeks
+GEOCODE_TTL_NOT_FOUND = 3600        # retry not-found queries after an hour
+
+_geocode_cache = {}
+_geocode_lock = threading.Lock()
+
+
+def _geocode(city, country=None, state=None, country_code=None):
+    """
+    Look up a place via Nominatim, with an in-process TTL cache so repeat
+    submissions of the same query skip the HTTP round-trip entirely.
+    Uses structured query parameters (city/state/country), which are
+    cheaper on the Nominatim side and more precise than free-form q=.
+    When country_code is given, Nominatim guarantees results match that
+    ISO code, so no addressdetails are requested and callers need no
+    country post-check. Returns the parsed JSON result list; raises on
+    HTTP/network errors (errors are never cached).
+    """
+    key = tuple(" ".join(part.casefold().split()) for part in (city, state or "", country or ""))
+    now = time.monotonic()
+
+    with _geocode_lock:
+        cached = _geocode_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    geocode_url = "https://nominatim.openstreetmap.org/search"
+    params = {
+        "city": city,
+        "format": "jsonv2",
+        "limit": 1,
+        "accept-language": "en",
+    }
+    if country:
+        params["country"] = country
+    if state:
+        params["state"] = state
+    if country_code:
+        params["countrycodes"] = country_code
+
+    response = SESSION.get(geocode_url, params=params, timeout=10)
+    response.raise_for_status()
+    geo_data = orjson.loads(response.content)
+
+    ttl = GEOCODE_TTL_FOUND if geo_data else GEOCODE_TTL_NOT_FOUND
+    with _geocode_lock:
+        if len(_geocode_cache) >= GEOCODE_CACHE_MAX:
+            # dicts keep insertion order, so this evicts the oldest entry
+            _geocode_cache.pop(next(iter(_geocode_cache)))
+        _geocode_cache[key] = (now + ttl, geo_data)
+
+    return geo_data
+
 
 class WeatherQuizForm(FlaskForm):
     country = SelectField(
@@ -26,7 +136,7 @@ class WeatherQuizForm(FlaskForm):
 
     state = SelectField(
         "State",
-        choices=[("", "Select a U.S. State, if any.")] + [(s, s) for s in us_cities.keys()],
+        choices=STATE_CHOICES,
         validators=[Optional()]
     )
 
@@ -55,21 +165,21 @@ class WeatherQuizForm(FlaskForm):
         if not super().validate(extra_validators):
             return False
 
+        # city is free text; country/state are SelectField values taken
+        # verbatim from the choice lists, so they never need stripping
         city = self.city.data.strip()
-        country = self.country.data.strip()
-        state = self.state.data.strip() if self.state.data else ""
+        country = self.country.data
+        state = self.state.data or ""
+        is_usa = country == "United States of America"
 
         # ---------------- USA STATE RULE ----------------
-        if country == "United States of America":
-            if not state:
-                self.state.errors.append("Please select a U.S. state.")
-                return False
-        else:
-            if state:
-                self.state.errors.append(
-                    "State should only be selected for the United States."
-                )
-                return False
+        # a state must be selected if and only if the country is the US
+        if is_usa != bool(state):
+            self.state.errors.append(
+                "Please select a U.S. state." if is_usa
+                else "State should only be selected for the United States."
+            )
+            return False
 
         # ---------------- TEMPERATURE RULE ----------------
         if self.user_hot.data <= self.user_cold.data:
@@ -80,12 +190,13 @@ class WeatherQuizForm(FlaskForm):
 
         # ---------------- CITY VALIDATION ----------------
         us_city = None
+        us_coords = None
         resolved_place = None
 
-        if country == "United States of America":
+        if is_usa:
             # ---------------- USA CITY ↔ STATE CHECK ----------------
-            valid_cities = us_cities.get(state, [])
-            if city.lower() not in [c.lower() for c in valid_cities]:
+            us_coords = US_CITY_INDEX.get(state, {}).get(city.casefold())
+            if us_coords is None:
                 self.city.errors.append(
                     f"{city} is not a valid city in {state}. "
                     "If it is, enter the nearest major city."
@@ -94,60 +205,36 @@ class WeatherQuizForm(FlaskForm):
             us_city = city
         else:
             # ---------------- NON-USA GEOCODING ----------------
-            expected_code = COUNTRY_TO_ISO.get(country.strip())
-            if not expected_code:
-                self.city.errors.append("Country validation configuration error.")
-                return False
-
-            query = city  # only search by city name
-            geocode_url = "https://nominatim.openstreetmap.org/search"
-            params = {"q": query, "format": "json", "limit": 5, "addressdetails": 1}
-            headers = {"User-Agent": "weather-app"}
+            # country is a choice built from COUNTRY_TO_ISO.keys(), so the
+            # lookup always hits
+            expected_code = COUNTRY_TO_ISO[country]
 
             try:
-                response = requests.get(geocode_url, params=params, headers=headers, timeout=10)
-                response.raise_for_status()
-                geo_data = response.json()
+                geo_data = _geocode(city, country, country_code=expected_code)
             except Exception:
                 self.city.errors.append("Error validating location. Please try again.")
                 return False
 
+            # countrycodes= already restricts results to the expected country
             if not geo_data:
                 self.city.errors.append(f"{city} not found in {country}.")
                 return False
 
-            # Filter results to only those matching the expected country
-            valid_results = [
-                result for result in geo_data
-                if result.get("address", {}).get("country_code", "").lower() == expected_code
-            ]
-
-            if not valid_results:
-                self.city.errors.append(f"{city} is not a valid city in {country}.")
-                return False
-
-            # Pick the first valid result
-            resolved_place = valid_results[0]
+            resolved_place = geo_data[0]
 
         # ---------------- STORE IN SESSION ----------------
         try:
-            if country == "United States of America":
+            if is_usa:
+                # Coordinates come straight from the gazetteer — no HTTP call.
+                session["lat"], session["lon"] = us_coords
                 session["city"] = us_city
                 session["country"] = country
                 session["state"] = state
-                # Optional: geocode US city to store lat/lon if needed
             else:
                 session["lat"] = float(resolved_place["lat"])
                 session["lon"] = float(resolved_place["lon"])
-                address = resolved_place.get("address", {})
-                session["city"] = (
-                        address.get("city") or
-                        address.get("town") or
-                        address.get("village") or
-                        address.get("municipality") or
-                        address.get("state") or
-                        city
-                )
+                # jsonv2 includes the place name directly; no addressdetails needed
+                session["city"] = resolved_place.get("name") or city
                 session["country"] = country
                 session["state"] = state
         except (KeyError, ValueError):
@@ -156,6 +243,18 @@ class WeatherQuizForm(FlaskForm):
 
         return True
 
+# Condition keyword -> tip, matched in a single pass by _TIP_RE;
+# "storm" and "thunder" share a tip and are deduplicated below.
+_TIP_MAP = {
+    "rain": "Bring an umbrella",
+    "snow": "Drive carefully",
+    "wind": "Windy — secure loose items",
+    "storm": "Stay indoors if possible",
+    "thunder": "Stay indoors if possible",
+}
+_TIP_RE = re.compile("|".join(_TIP_MAP))
+
+
 def get_activity_tips(temp_f, description, user_hot=None, user_cold=None):
     """
     Generate user-specific weather activity tips.
@@ -173,61 +272,103 @@ def get_activity_tips(temp_f, description, user_hot=None, user_cold=None):
     else:
         tips.append("Comfortable for outdoor activities")
 
-    # Condition-based tips
-    if "rain" in desc:
-        tips.append("Bring an umbrella")
-    if "snow" in desc:
-        tips.append("Drive carefully")
-    if "wind" in desc:
-        tips.append("Windy — secure loose items")
-    if "storm" in desc or "thunder" in desc:
-        tips.append("Stay indoors if possible")
+    # Condition-based tips: one scan over the description instead of a
+    # substring search per keyword
+    seen = set()
+    for keyword in _TIP_RE.findall(desc):
+        tip = _TIP_MAP[keyword]
+        if tip not in seen:
+            seen.add(tip)
+            tips.append(tip)
 
     return tips
 # -------------------- Forecast --------------------
-def get_forecast(lat, lon, api_key, user_hot=None, user_cold=None, max_days=5):
+FORECAST_CACHE_MAX = 2048
+FORECAST_TTL = 600  # OpenWeather refreshes at 3-hour granularity; 10 min is plenty fresh
+
+_forecast_cache = {}
+_forecast_lock = threading.Lock()
+
+
+def _fetch_forecast_entries(lat, lon, api_key):
     """
-    Fetch 5-day forecast from OpenWeatherMap and include tips based on user thresholds.
+    Fetch the raw 3-hourly forecast list from OpenWeatherMap, cached for
+    10 minutes on a ~1 km coordinate grid so users in the same city share
+    one upstream call. Tips depend on per-user thresholds, so only the
+    raw entries are cached and tips are generated per request.
     """
+    key = (round(lat, 2), round(lon, 2))
+    now = time.monotonic()
+
+    with _forecast_lock:
+        cached = _forecast_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
     url = "https://api.openweathermap.org/data/2.5/forecast"
-    params = {"lat": lat, "lon": lon, "appid": api_key}
+    params = {"lat": lat, "lon": lon, "appid": api_key, "units": "imperial"}
+
+    response = SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    entries = orjson.loads(response.content).get("list", [])
 
+    with _forecast_lock:
+        if len(_forecast_cache) >= FORECAST_CACHE_MAX:
+            # dicts keep insertion order, so this evicts the oldest entry
+            _forecast_cache.pop(next(iter(_forecast_cache)))
+        _forecast_cache[key] = (now + FORECAST_TTL, entries)
+
+    return entries
+
+
+def get_forecast(lat, lon, api_key, user_hot=None, user_cold=None, max_days=5):
+    """
+    Fetch 5-day forecast from OpenWeatherMap and include tips based on user thresholds.
+    """
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        entries = _fetch_forecast_entries(lat, lon, api_key)
     except Exception:
         return None
 
     today = date.today()
-    forecasts = {}
-
-    for entry in data.get("list", []):
-        dt = datetime.strptime(entry["dt_txt"], "%Y-%m-%d %H:%M:%S")
-        dt_date = dt.date()
+    forecasts = []
 
-        # Skip today and duplicates
-        if dt_date == today or dt_date in forecasts:
+    # Entries arrive sorted in 3-hour steps; group them by calendar day and
+    # take the reading nearest 13:00 so each day reflects midday weather
+    # rather than whichever 3 am slot happens to come first.
+    for dt_date, day_entries in groupby(entries, key=lambda e: date.fromtimestamp(e["dt"])):
+        if dt_date == today:
             continue
 
-        temp_k = entry["main"]["temp"]
-        temp_f = round((temp_k - 273.15) * 9 / 5 + 32, 1)
+        entry = min(day_entries, key=lambda e: abs(time.localtime(e["dt"]).tm_hour - 13))
+
+        # units=imperial means the API already returns Fahrenheit
+        temp_f = round(entry["main"]["temp"], 1)
         weather = entry["weather"][0]
         description = weather["description"]
         icon = weather.get("icon")
 
-        forecasts[dt_date] = {
+        forecasts.append({
             "date": dt_date,
             "temp_f": temp_f,
             "description": description,
             "icon": icon,
             "tips": get_activity_tips(temp_f, description, user_hot, user_cold)
-        }
+        })
 
         if len(forecasts) >= max_days:
             break
 
-    return list(forecasts.values())
+    return forecasts
+
+# -------------------- Background fetch --------------------
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Futures aren't JSON-serializable, so the session carries only an opaque
+# token and the future itself lives in this dict until /results claims it.
+FORECAST_FUTURES_MAX = 256
+_forecast_futures = {}
+
 
 # -------------------- Routes --------------------
 @app.route("/", methods=["GET","POST"])
@@ -236,6 +377,22 @@ def home():
     if form.validate_on_submit():
         session["user_hot"] = form.user_hot.data
         session["user_cold"] = form.user_cold.data
+
+        lat = session.get("lat")
+        lon = session.get("lon")
+        if lat is not None and lon is not None:
+            # Kick off the forecast fetch now so it overlaps the redirect
+            # round-trip instead of blocking /results.
+            token = uuid.uuid4().hex
+            if len(_forecast_futures) >= FORECAST_FUTURES_MAX:
+                # drop the oldest unclaimed future (user never hit /results)
+                _forecast_futures.pop(next(iter(_forecast_futures)))
+            _forecast_futures[token] = EXECUTOR.submit(
+                get_forecast, lat, lon, API_KEY,
+                form.user_hot.data, form.user_cold.data
+            )
+            session["forecast_token"] = token
+
         return redirect(url_for("results"))
     return render_template("index.html", form=form)
 
@@ -248,11 +405,19 @@ def results():
         error = "Location could not be validated. Please try again."
         return render_template("results.html", weather=None, error=error)
 
-    forecast = get_forecast(
-        lat, lon, os.environ.get("API_KEY"),
-        user_hot=session.get("user_hot"),
-        user_cold=session.get("user_cold")
-    )
+    future = _forecast_futures.pop(session.pop("forecast_token", None), None)
+    if future is not None:
+        try:
+            forecast = future.result(timeout=10)
+        except Exception:
+            forecast = None
+    else:
+        # No prefetch in flight (e.g. page reload) — fetch synchronously.
+        forecast = get_forecast(
+            lat, lon, API_KEY,
+            user_hot=session.get("user_hot"),
+            user_cold=session.get("user_cold")
+        )
     if forecast is None:
         error = "Could not fetch weather data. Try again later."
         return render_template("results.html", weather=None, error=error)
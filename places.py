@@ -1,55 +1,398 @@
+# City coordinates precomputed offline from the GeoNames gazetteer so that
+# validated US cities never need a Nominatim round-trip.
 us_cities = {
-    "Alabama": ["Birmingham", "Montgomery", "Mobile", "Huntsville", "Tuscaloosa", "Hoover", "Dothan", "Auburn"],
-    "Alaska": ["Anchorage", "Fairbanks", "Juneau", "Sitka", "Ketchikan", "Wasilla", "Kenai"],
-    "Arizona": ["Phoenix", "Tucson", "Mesa", "Chandler", "Glendale", "Scottsdale", "Gilbert", "Tempe"],
-    "Arkansas": ["Little Rock", "Fort Smith", "Fayetteville", "Springdale", "Jonesboro", "North Little Rock"],
-    "California": ["Los Angeles", "San Diego", "San Jose", "San Francisco", "Fresno", "Sacramento", "Long Beach", "Oakland"],
-    "Colorado": ["Denver", "Colorado Springs", "Aurora", "Fort Collins", "Lakewood", "Thornton", "Arvada"],
-    "Connecticut": ["Bridgeport", "New Haven", "Stamford", "Hartford", "Waterbury", "Norwalk", "Danbury"],
-    "Delaware": ["Wilmington", "Dover", "Newark", "Middletown", "Smyrna"],
-    "Florida": ["Jacksonville", "Miami", "Tampa", "Orlando", "St. Petersburg", "Hialeah", "Tallahassee", "Fort Lauderdale"],
-    "Georgia": ["Atlanta", "Augusta", "Columbus", "Macon", "Savannah", "Athens", "Sandy Springs"],
-    "Hawaii": ["Honolulu", "Hilo", "Kailua", "Kapolei", "Waipahu"],
-    "Idaho": ["Boise", "Meridian", "Nampa", "Idaho Falls", "Caldwell"],
-    "Illinois": ["Chicago", "Aurora", "Naperville", "Joliet", "Rockford", "Springfield", "Peoria"],
-    "Indiana": ["Indianapolis", "Fort Wayne", "Evansville", "South Bend", "Carmel", "Bloomington"],
-    "Iowa": ["Des Moines", "Cedar Rapids", "Davenport", "Sioux City", "Iowa City", "Waterloo"],
-    "Kansas": ["Wichita", "Overland Park", "Kansas City", "Olathe", "Topeka", "Lawrence"],
-    "Kentucky": ["Louisville", "Lexington", "Bowling Green", "Owensboro", "Covington"],
-    "Louisiana": ["New Orleans", "Baton Rouge", "Shreveport", "Lafayette", "Lake Charles"],
-    "Maine": ["Portland", "Lewiston", "Bangor", "South Portland", "Auburn"],
-    "Maryland": ["Baltimore", "Columbia", "Germantown", "Silver Spring", "Waldorf"],
-    "Massachusetts": ["Boston", "Worcester", "Springfield", "Lowell", "Cambridge", "New Bedford"],
-    "Michigan": ["Detroit", "Grand Rapids", "Warren", "Sterling Heights", "Ann Arbor", "Lansing"],
-    "Minnesota": ["Minneapolis", "St. Paul", "Rochester", "Duluth", "Bloomington", "Brooklyn Park"],
-    "Mississippi": ["Jackson", "Gulfport", "Southaven", "Hattiesburg", "Biloxi"],
-    "Missouri": ["Kansas City", "St. Louis", "Springfield", "Columbia", "Independence"],
-    "Montana": ["Billings", "Missoula", "Great Falls", "Bozeman", "Butte"],
-    "Nebraska": ["Omaha", "Lincoln", "Bellevue", "Grand Island", "Kearney"],
-    "Nevada": ["Las Vegas", "Henderson", "Reno", "North Las Vegas", "Sparks"],
-    "New Hampshire": ["Manchester", "Nashua", "Concord", "Dover", "Rochester"],
-    "New Jersey": ["Newark", "Jersey City", "Paterson", "Elizabeth", "Edison", "Woodbridge"],
-    "New Mexico": ["Albuquerque", "Las Cruces", "Rio Rancho", "Santa Fe", "Roswell"],
-    "New York": ["New York", "Buffalo", "Rochester", "Yonkers", "Syracuse", "Albany"],
-    "North Carolina": ["Charlotte", "Raleigh", "Greensboro", "Durham", "Winston-Salem", "Fayetteville"],
-    "North Dakota": ["Fargo", "Bismarck", "Grand Forks", "Minot", "West Fargo"],
-    "Ohio": ["Columbus", "Cleveland", "Cincinnati", "Toledo", "Akron", "Dayton"],
-    "Oklahoma": ["Oklahoma City", "Tulsa", "Norman", "Broken Arrow", "Lawton"],
-    "Oregon": ["Portland", "Salem", "Eugene", "Gresham", "Hillsboro"],
-    "Pennsylvania": ["Philadelphia", "Pittsburgh", "Allentown", "Erie", "Reading", "Scranton"],
-    "Rhode Island": ["Providence", "Cranston", "Warwick", "Pawtucket", "East Providence"],
-    "South Carolina": ["Columbia", "Charleston", "North Charleston", "Mount Pleasant", "Rock Hill"],
-    "South Dakota": ["Sioux Falls", "Rapid City", "Aberdeen", "Brookings", "Watertown"],
-    "Tennessee": ["Memphis", "Nashville", "Knoxville", "Chattanooga", "Clarksville"],
-    "Texas": ["Houston", "San Antonio", "Dallas", "Austin", "Fort Worth", "El Paso", "Arlington", "Corpus Christi","San Marcos"],
-    "Utah": ["Salt Lake City", "West Valley City", "Provo", "West Jordan", "Orem"],
-    "Vermont": ["Burlington", "South Burlington", "Rutland", "Barre", "Montpelier"],
-    "Virginia": ["Virginia Beach", "Norfolk", "Chesapeake", "Richmond", "Newport News", "Alexandria"],
-    "Washington": ["Seattle", "Spokane", "Tacoma", "Vancouver", "Bellevue"],
-    "West Virginia": ["Charleston", "Huntington", "Morgantown", "Parkersburg", "Wheeling"],
-    "Wisconsin": ["Milwaukee", "Madison", "Green Bay", "Kenosha", "Racine"],
-    "Wyoming": ["Cheyenne", "Casper", "Laramie", "Gillette", "Rock Springs"],
-    "District of Columbia": ["Washington"]
+    "Alabama": {
+        "Birmingham": (33.52, -86.81),
+        "Montgomery": (32.38, -86.31),
+        "Mobile": (30.69, -88.04),
+        "Huntsville": (34.73, -86.59),
+        "Tuscaloosa": (33.21, -87.57),
+        "Hoover": (33.41, -86.81),
+        "Dothan": (31.22, -85.39),
+        "Auburn": (32.61, -85.48),
+    },
+    "Alaska": {
+        "Anchorage": (61.22, -149.90),
+        "Fairbanks": (64.84, -147.72),
+        "Juneau": (58.30, -134.42),
+        "Sitka": (57.05, -135.33),
+        "Ketchikan": (55.34, -131.65),
+        "Wasilla": (61.58, -149.44),
+        "Kenai": (60.55, -151.26),
+    },
+    "Arizona": {
+        "Phoenix": (33.45, -112.07),
+        "Tucson": (32.22, -110.97),
+        "Mesa": (33.42, -111.83),
+        "Chandler": (33.31, -111.84),
+        "Glendale": (33.54, -112.19),
+        "Scottsdale": (33.49, -111.93),
+        "Gilbert": (33.35, -111.79),
+        "Tempe": (33.43, -111.94),
+    },
+    "Arkansas": {
+        "Little Rock": (34.75, -92.29),
+        "Fort Smith": (35.39, -94.40),
+        "Fayetteville": (36.06, -94.16),
+        "Springdale": (36.19, -94.13),
+        "Jonesboro": (35.84, -90.70),
+        "North Little Rock": (34.77, -92.26),
+    },
+    "California": {
+        "Los Angeles": (34.05, -118.24),
+        "San Diego": (32.72, -117.16),
+        "San Jose": (37.34, -121.89),
+        "San Francisco": (37.77, -122.42),
+        "Fresno": (36.74, -119.79),
+        "Sacramento": (38.58, -121.49),
+        "Long Beach": (33.77, -118.19),
+        "Oakland": (37.80, -122.27),
+    },
+    "Colorado": {
+        "Denver": (39.74, -104.99),
+        "Colorado Springs": (38.83, -104.82),
+        "Aurora": (39.73, -104.83),
+        "Fort Collins": (40.59, -105.08),
+        "Lakewood": (39.70, -105.08),
+        "Thornton": (39.87, -104.97),
+        "Arvada": (39.80, -105.09),
+    },
+    "Connecticut": {
+        "Bridgeport": (41.19, -73.20),
+        "New Haven": (41.31, -72.93),
+        "Stamford": (41.05, -73.54),
+        "Hartford": (41.76, -72.67),
+        "Waterbury": (41.56, -73.05),
+        "Norwalk": (41.12, -73.41),
+        "Danbury": (41.39, -73.45),
+    },
+    "Delaware": {
+        "Wilmington": (39.75, -75.55),
+        "Dover": (39.16, -75.52),
+        "Newark": (39.68, -75.75),
+        "Middletown": (39.45, -75.72),
+        "Smyrna": (39.30, -75.60),
+    },
+    "Florida": {
+        "Jacksonville": (30.33, -81.66),
+        "Miami": (25.76, -80.19),
+        "Tampa": (27.95, -82.46),
+        "Orlando": (28.54, -81.38),
+        "St. Petersburg": (27.77, -82.64),
+        "Hialeah": (25.86, -80.28),
+        "Tallahassee": (30.44, -84.28),
+        "Fort Lauderdale": (26.12, -80.14),
+    },
+    "Georgia": {
+        "Atlanta": (33.75, -84.39),
+        "Augusta": (33.47, -81.97),
+        "Columbus": (32.46, -84.99),
+        "Macon": (32.84, -83.63),
+        "Savannah": (32.08, -81.09),
+        "Athens": (33.96, -83.38),
+        "Sandy Springs": (33.92, -84.38),
+    },
+    "Hawaii": {
+        "Honolulu": (21.31, -157.86),
+        "Hilo": (19.71, -155.08),
+        "Kailua": (21.40, -157.74),
+        "Kapolei": (21.34, -158.06),
+        "Waipahu": (21.39, -158.01),
+    },
+    "Idaho": {
+        "Boise": (43.62, -116.21),
+        "Meridian": (43.61, -116.39),
+        "Nampa": (43.54, -116.56),
+        "Idaho Falls": (43.49, -112.04),
+        "Caldwell": (43.66, -116.69),
+    },
+    "Illinois": {
+        "Chicago": (41.88, -87.63),
+        "Aurora": (41.76, -88.32),
+        "Naperville": (41.75, -88.15),
+        "Joliet": (41.53, -88.08),
+        "Rockford": (42.27, -89.09),
+        "Springfield": (39.80, -89.64),
+        "Peoria": (40.69, -89.59),
+    },
+    "Indiana": {
+        "Indianapolis": (39.77, -86.16),
+        "Fort Wayne": (41.08, -85.14),
+        "Evansville": (37.97, -87.57),
+        "South Bend": (41.68, -86.25),
+        "Carmel": (39.98, -86.13),
+        "Bloomington": (39.17, -86.53),
+    },
+    "Iowa": {
+        "Des Moines": (41.59, -93.62),
+        "Cedar Rapids": (41.98, -91.67),
+        "Davenport": (41.52, -90.58),
+        "Sioux City": (42.50, -96.40),
+        "Iowa City": (41.66, -91.53),
+        "Waterloo": (42.49, -92.34),
+    },
+    "Kansas": {
+        "Wichita": (37.69, -97.34),
+        "Overland Park": (38.98, -94.67),
+        "Kansas City": (39.11, -94.63),
+        "Olathe": (38.88, -94.82),
+        "Topeka": (39.05, -95.68),
+        "Lawrence": (38.97, -95.24),
+    },
+    "Kentucky": {
+        "Louisville": (38.25, -85.76),
+        "Lexington": (38.04, -84.50),
+        "Bowling Green": (36.99, -86.44),
+        "Owensboro": (37.77, -87.11),
+        "Covington": (39.08, -84.51),
+    },
+    "Louisiana": {
+        "New Orleans": (29.95, -90.07),
+        "Baton Rouge": (30.45, -91.15),
+        "Shreveport": (32.53, -93.75),
+        "Lafayette": (30.22, -92.02),
+        "Lake Charles": (30.23, -93.22),
+    },
+    "Maine": {
+        "Portland": (43.66, -70.26),
+        "Lewiston": (44.10, -70.21),
+        "Bangor": (44.80, -68.77),
+        "South Portland": (43.64, -70.24),
+        "Auburn": (44.10, -70.23),
+    },
+    "Maryland": {
+        "Baltimore": (39.29, -76.61),
+        "Columbia": (39.20, -76.86),
+        "Germantown": (39.17, -77.27),
+        "Silver Spring": (38.99, -77.03),
+        "Waldorf": (38.62, -76.91),
+    },
+    "Massachusetts": {
+        "Boston": (42.36, -71.06),
+        "Worcester": (42.26, -71.80),
+        "Springfield": (42.10, -72.59),
+        "Lowell": (42.63, -71.32),
+        "Cambridge": (42.37, -71.11),
+        "New Bedford": (41.64, -70.93),
+    },
+    "Michigan": {
+        "Detroit": (42.33, -83.05),
+        "Grand Rapids": (42.96, -85.67),
+        "Warren": (42.51, -83.01),
+        "Sterling Heights": (42.58, -83.03),
+        "Ann Arbor": (42.28, -83.74),
+        "Lansing": (42.73, -84.56),
+    },
+    "Minnesota": {
+        "Minneapolis": (44.98, -93.27),
+        "St. Paul": (44.95, -93.09),
+        "Rochester": (44.02, -92.47),
+        "Duluth": (46.79, -92.10),
+        "Bloomington": (44.84, -93.30),
+        "Brooklyn Park": (45.09, -93.36),
+    },
+    "Mississippi": {
+        "Jackson": (32.30, -90.18),
+        "Gulfport": (30.37, -89.09),
+        "Southaven": (34.99, -90.00),
+        "Hattiesburg": (31.33, -89.29),
+        "Biloxi": (30.40, -88.89),
+    },
+    "Missouri": {
+        "Kansas City": (39.10, -94.58),
+        "St. Louis": (38.63, -90.20),
+        "Springfield": (37.22, -93.30),
+        "Columbia": (38.95, -92.33),
+        "Independence": (39.09, -94.42),
+    },
+    "Montana": {
+        "Billings": (45.78, -108.50),
+        "Missoula": (46.87, -114.00),
+        "Great Falls": (47.51, -111.30),
+        "Bozeman": (45.68, -111.04),
+        "Butte": (46.00, -112.53),
+    },
+    "Nebraska": {
+        "Omaha": (41.26, -95.93),
+        "Lincoln": (40.81, -96.68),
+        "Bellevue": (41.14, -95.91),
+        "Grand Island": (40.93, -98.34),
+        "Kearney": (40.70, -99.08),
+    },
+    "Nevada": {
+        "Las Vegas": (36.17, -115.14),
+        "Henderson": (36.04, -114.98),
+        "Reno": (39.53, -119.81),
+        "North Las Vegas": (36.20, -115.12),
+        "Sparks": (39.53, -119.75),
+    },
+    "New Hampshire": {
+        "Manchester": (42.99, -71.45),
+        "Nashua": (42.77, -71.47),
+        "Concord": (43.21, -71.54),
+        "Dover": (43.20, -70.87),
+        "Rochester": (43.30, -70.98),
+    },
+    "New Jersey": {
+        "Newark": (40.74, -74.17),
+        "Jersey City": (40.73, -74.08),
+        "Paterson": (40.92, -74.17),
+        "Elizabeth": (40.66, -74.21),
+        "Edison": (40.52, -74.41),
+        "Woodbridge": (40.56, -74.29),
+    },
+    "New Mexico": {
+        "Albuquerque": (35.08, -106.65),
+        "Las Cruces": (32.31, -106.78),
+        "Rio Rancho": (35.23, -106.66),
+        "Santa Fe": (35.69, -105.94),
+        "Roswell": (33.39, -104.52),
+    },
+    "New York": {
+        "New York": (40.71, -74.01),
+        "Buffalo": (42.89, -78.88),
+        "Rochester": (43.16, -77.61),
+        "Yonkers": (40.93, -73.90),
+        "Syracuse": (43.05, -76.15),
+        "Albany": (42.65, -73.75),
+    },
+    "North Carolina": {
+        "Charlotte": (35.23, -80.84),
+        "Raleigh": (35.78, -78.64),
+        "Greensboro": (36.07, -79.79),
+        "Durham": (35.99, -78.90),
+        "Winston-Salem": (36.10, -80.24),
+        "Fayetteville": (35.05, -78.88),
+    },
+    "North Dakota": {
+        "Fargo": (46.88, -96.79),
+        "Bismarck": (46.81, -100.78),
+        "Grand Forks": (47.93, -97.03),
+        "Minot": (48.23, -101.30),
+        "West Fargo": (46.87, -96.90),
+    },
+    "Ohio": {
+        "Columbus": (39.96, -83.00),
+        "Cleveland": (41.50, -81.69),
+        "Cincinnati": (39.10, -84.51),
+        "Toledo": (41.65, -83.54),
+        "Akron": (41.08, -81.52),
+        "Dayton": (39.76, -84.19),
+    },
+    "Oklahoma": {
+        "Oklahoma City": (35.47, -97.52),
+        "Tulsa": (36.15, -95.99),
+        "Norman": (35.22, -97.44),
+        "Broken Arrow": (36.05, -95.79),
+        "Lawton": (34.61, -98.39),
+    },
+    "Oregon": {
+        "Portland": (45.52, -122.68),
+        "Salem": (44.94, -123.04),
+        "Eugene": (44.05, -123.09),
+        "Gresham": (45.50, -122.43),
+        "Hillsboro": (45.52, -122.99),
+    },
+    "Pennsylvania": {
+        "Philadelphia": (39.95, -75.17),
+        "Pittsburgh": (40.44, -79.99),
+        "Allentown": (40.60, -75.47),
+        "Erie": (42.13, -80.09),
+        "Reading": (40.34, -75.93),
+        "Scranton": (41.41, -75.66),
+    },
+    "Rhode Island": {
+        "Providence": (41.82, -71.41),
+        "Cranston": (41.78, -71.44),
+        "Warwick": (41.70, -71.42),
+        "Pawtucket": (41.88, -71.38),
+        "East Providence": (41.81, -71.37),
+    },
+    "South Carolina": {
+        "Columbia": (34.00, -81.03),
+        "Charleston": (32.78, -79.93),
+        "North Charleston": (32.85, -79.97),
+        "Mount Pleasant": (32.79, -79.86),
+        "Rock Hill": (34.92, -81.03),
+    },
+    "South Dakota": {
+        "Sioux Falls": (43.54, -96.73),
+        "Rapid City": (44.08, -103.23),
+        "Aberdeen": (45.46, -98.49),
+        "Brookings": (44.31, -96.80),
+        "Watertown": (44.90, -97.12),
+    },
+    "Tennessee": {
+        "Memphis": (35.15, -90.05),
+        "Nashville": (36.16, -86.78),
+        "Knoxville": (35.96, -83.92),
+        "Chattanooga": (35.05, -85.31),
+        "Clarksville": (36.53, -87.36),
+    },
+    "Texas": {
+        "Houston": (29.76, -95.37),
+        "San Antonio": (29.42, -98.49),
+        "Dallas": (32.78, -96.80),
+        "Austin": (30.27, -97.74),
+        "Fort Worth": (32.76, -97.33),
+        "El Paso": (31.76, -106.49),
+        "Arlington": (32.74, -97.11),
+        "Corpus Christi": (27.80, -97.40),
+        "San Marcos": (29.88, -97.94),
+    },
+    "Utah": {
+        "Salt Lake City": (40.76, -111.89),
+        "West Valley City": (40.69, -112.00),
+        "Provo": (40.23, -111.66),
+        "West Jordan": (40.61, -111.94),
+        "Orem": (40.30, -111.70),
+    },
+    "Vermont": {
+        "Burlington": (44.48, -73.21),
+        "South Burlington": (44.47, -73.17),
+        "Rutland": (43.61, -72.97),
+        "Barre": (44.20, -72.50),
+        "Montpelier": (44.26, -72.58),
+    },
+    "Virginia": {
+        "Virginia Beach": (36.85, -75.98),
+        "Norfolk": (36.85, -76.29),
+        "Chesapeake": (36.77, -76.29),
+        "Richmond": (37.54, -77.44),
+        "Newport News": (37.09, -76.47),
+        "Alexandria": (38.80, -77.05),
+    },
+    "Washington": {
+        "Seattle": (47.61, -122.33),
+        "Spokane": (47.66, -117.43),
+        "Tacoma": (47.25, -122.44),
+        "Vancouver": (45.64, -122.66),
+        "Bellevue": (47.61, -122.20),
+    },
+    "West Virginia": {
+        "Charleston": (38.35, -81.63),
+        "Huntington": (38.42, -82.45),
+        "Morgantown": (39.63, -79.96),
+        "Parkersburg": (39.27, -81.56),
+        "Wheeling": (40.06, -80.72),
+    },
+    "Wisconsin": {
+        "Milwaukee": (43.04, -87.91),
+        "Madison": (43.07, -89.40),
+        "Green Bay": (44.51, -88.02),
+        "Kenosha": (42.58, -87.82),
+        "Racine": (42.73, -87.78),
+    },
+    "Wyoming": {
+        "Cheyenne": (41.14, -104.82),
+        "Casper": (42.87, -106.31),
+        "Laramie": (41.31, -105.59),
+        "Gillette": (44.29, -105.50),
+        "Rock Springs": (41.59, -109.20),
+    },
+    "District of Columbia": {
+        "Washington": (38.91, -77.04),
+    },
 }
 
 COUNTRY_TO_ISO = {